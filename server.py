@@ -10,6 +10,10 @@
 #   DUMMYLLM_RANDOM_WEIGHTS = "ok=70,echo=10,slow=10,fail=5,hang=3,timeout=2,flaky=0"
 #   DUMMYLLM_LATENCY_MS = 250
 #   DUMMYLLM_SEED = 1337
+#   DUMMYLLM_JOBS_MAX = 10000        (jobs kept in memory; oldest evicted first)
+#   DUMMYLLM_JOBS_TTL = 3600         (seconds a finished job is kept; 0 = forever)
+#   DUMMYLLM_MAX_INFLIGHT = 1000     (jobs simulated concurrently; the rest stay queued)
+#   DUMMYLLM_GZIP_MIN = 1024         (gzip responses of at least this many bytes; 0 = off)
 #
 # Endpoints:
 #   GET  /health
@@ -21,20 +25,29 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
+import itertools
 import json
 import os
 import random
+import secrets
 import time
-import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Any, Dict, List, Literal, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, List, Literal, Mapping, Optional, Set, Tuple
 
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel, Field
 
 State = Literal["queued", "running", "ok", "fail", "timeout", "cancelled"]
 Mode = Literal["ok", "echo", "slow", "fail", "hang", "flaky", "timeout", "random"]
 
+TERMINAL_STATES = ("ok", "fail", "timeout", "cancelled")
+
 # ---------------- ENV CONFIG ----------------
 
 def _env_str(name: str, default: str) -> str:
@@ -55,7 +68,9 @@ def parse_weights(s: str) -> Dict[str, int]:
     Parse "ok=70,echo=10,slow=10,fail=5,hang=3,timeout=2,flaky=0"
     Unknown keys are ignored. Missing keys default to 0.
     """
-    allowed = {"ok", "echo", "slow", "fail", "hang", "flaky", "timeout"}
+    # tuple, not set: key order feeds the cumulative table, so it must not
+    # depend on per-process string hashing for seeded runs to reproduce
+    allowed = ("ok", "echo", "slow", "fail", "hang", "flaky", "timeout")
     out = {k: 0 for k in allowed}
     parts = [p.strip() for p in (s or "").split(",") if p.strip()]
     for p in parts:
@@ -79,30 +94,75 @@ DUMMYLLM_RANDOM_WEIGHTS_RAW = _env_str(
 DUMMYLLM_RANDOM_WEIGHTS = parse_weights(DUMMYLLM_RANDOM_WEIGHTS_RAW)
 DUMMYLLM_LATENCY_MS = max(0, _env_int("DUMMYLLM_LATENCY_MS", 250))
 DUMMYLLM_SEED = _env_int("DUMMYLLM_SEED", 1337)
+DUMMYLLM_JOBS_MAX = max(1, _env_int("DUMMYLLM_JOBS_MAX", 10000))
+DUMMYLLM_JOBS_TTL = max(0, _env_int("DUMMYLLM_JOBS_TTL", 3600))
+DUMMYLLM_MAX_INFLIGHT = max(1, _env_int("DUMMYLLM_MAX_INFLIGHT", 1000))
+DUMMYLLM_GZIP_MIN = max(0, _env_int("DUMMYLLM_GZIP_MIN", 1024))
 
 # global RNG for mode selection (deterministic if seed fixed)
+# no lock needed: handlers run on one event loop thread and the draw never awaits
 _mode_rng = random.Random(DUMMYLLM_SEED)
-_mode_rng_lock = asyncio.Lock()
+
+_U64 = 0xFFFFFFFFFFFFFFFF
+
+def fast_uniform(seed: int) -> float:
+    """
+    One splitmix64 step -> float in [0, 1).
+    Cheap stand-in for random.Random(seed).random() where only a single
+    deterministic draw is needed (no Mersenne Twister state to build).
+    """
+    z = (seed + 0x9E3779B97F4A7C15) & _U64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _U64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _U64
+    z ^= z >> 31
+    return (z >> 11) / (1 << 53)
+
+# wall-clock seconds, refreshed on each second boundary by clock_tick_forever()
+# while the lifespan runs; None when no ticker is running (no lifespan, or
+# mounted as a sub-app), so now_sec() reads the clock directly instead
+_NOW: Optional[int] = None
 
 def now_sec() -> int:
-    return int(time.time())
+    now = _NOW
+    return now if now is not None else int(time.time())
 
-def weighted_choice(weights: Dict[str, int]) -> Mode:
-    # if all zero -> default ok
-    total = sum(weights.values())
-    if total <= 0:
-        return "ok"
-    r = _mode_rng.randrange(1, total + 1)
+async def clock_tick_forever() -> None:
+    global _NOW
+    try:
+        while True:
+            t = time.time()
+            _NOW = int(t)
+            await asyncio.sleep(1.0 - (t - _NOW))
+    finally:
+        _NOW = None
+
+def cumulative_weights(weights: Dict[str, int]) -> Tuple[List[str], List[int]]:
+    """
+    Build (keys, running totals) for the positive weights, in dict order.
+    """
+    keys: List[str] = []
+    cum: List[int] = []
     acc = 0
     for k, w in weights.items():
         if w <= 0:
             continue
         acc += w
-        if r <= acc:
-            return k  # type: ignore
-    return "ok"
+        keys.append(k)
+        cum.append(acc)
+    return keys, cum
+
+_CUM_KEYS, _CUM_WEIGHTS = cumulative_weights(DUMMYLLM_RANDOM_WEIGHTS)
+_TOTAL_WEIGHT = _CUM_WEIGHTS[-1] if _CUM_WEIGHTS else 0
+
+def weighted_choice() -> Mode:
+    # if all zero -> default ok
+    if _TOTAL_WEIGHT <= 0:
+        return "ok"
+    # first running total > r, i.e. the bucket r falls in
+    r = _mode_rng.randrange(_TOTAL_WEIGHT)
+    return _CUM_KEYS[bisect.bisect_right(_CUM_WEIGHTS, r)]  # type: ignore
 
-async def choose_mode_for_job() -> Mode:
+def choose_mode_for_job() -> Mode:
     """
     Choose mode based on global DUMMYLLM_MODE.
     If random, choose weighted per job using deterministic RNG.
@@ -111,12 +171,40 @@ async def choose_mode_for_job() -> Mode:
     m = DUMMYLLM_MODE
     if m != "random":
         return m
-    async with _mode_rng_lock:
-        return weighted_choice(DUMMYLLM_RANDOM_WEIGHTS)
+    return weighted_choice()
 
 # ---------------- API MODELS ----------------
 
-app = FastAPI(title="dummyLLM", version="0.3.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # job concurrency state lives with the app, not the module: asyncio
+    # primitives bind to the loop they first wait on
+    app.state.job_slots = asyncio.Semaphore(DUMMYLLM_MAX_INFLIGHT)
+    app.state.job_tasks = set()
+    background = [asyncio.create_task(clock_tick_forever())]
+    if DUMMYLLM_JOBS_TTL > 0:
+        background.append(asyncio.create_task(sweep_jobs_forever()))
+    try:
+        yield
+    finally:
+        for t in background:
+            t.cancel()
+        for t in list(app.state.job_tasks):
+            t.cancel()
+
+app = FastAPI(title="dummyLLM", version="0.3.0", lifespan=lifespan)
+if DUMMYLLM_GZIP_MIN > 0:
+    # only for clients sending Accept-Encoding: gzip; small bodies pass through
+    app.add_middleware(GZipMiddleware, minimum_size=DUMMYLLM_GZIP_MIN)
+
+class HealthResp(BaseModel):
+    ok: bool
+    name: str
+    time: int
+    mode: str
+    latency_ms: int
+    seed: int
+    random_weights: Optional[Dict[str, int]] = None
 
 class JobCreate(BaseModel):
     op: str
@@ -133,11 +221,11 @@ class JobError(BaseModel):
     code: str
     message: str
 
+_DEFAULT_USAGE: Dict[str, int] = {"prompt_tokens": 0, "completion_tokens": 0}
+
 class JobResult(BaseModel):
     text: str
-    usage: Dict[str, int] = Field(
-        default_factory=lambda: {"prompt_tokens": 0, "completion_tokens": 0}
-    )
+    usage: Dict[str, int] = Field(default_factory=_DEFAULT_USAGE.copy)
 
 class JobStatus(BaseModel):
     id: str
@@ -157,9 +245,13 @@ class JobRequestView(BaseModel):
     random_weights: Optional[Dict[str, int]] = None
     seed: int
 
+class JobCancelResp(BaseModel):
+    id: str
+    state: State
+
 # ---------------- JOB STORE ----------------
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     id: str
     state: State
@@ -175,36 +267,90 @@ class Job:
     result: Optional[JobResult] = None
     error: Optional[JobError] = None
     task: Optional[asyncio.Task] = None
+    # serialized JobStatus, set once the job reaches a terminal state; result
+    # and error models are only built when that serialization fails
+    status_bytes: Optional[bytes] = None
+
+# job ids: random per-process prefix + counter (no urandom read per job)
+_ID_PREFIX = secrets.token_hex(4)
+_ID_CTR = itertools.count()
+
+def new_job_id() -> str:
+    return f"job_{_ID_PREFIX}{next(_ID_CTR) & 0xFFFFFFFF:08x}"
+
+# access ordered: the first entry is the least recently used job
+JOBS: OrderedDict[str, Job] = OrderedDict()
 
-JOBS: Dict[str, Job] = {}
+def store_job(job: Job) -> None:
+    JOBS[job.id] = job
+    while len(JOBS) > DUMMYLLM_JOBS_MAX:
+        _, old = JOBS.popitem(last=False)
+        if old.task and not old.task.done():
+            old.task.cancel()
+
+def lookup_job(job_id: str) -> Optional[Job]:
+    job = JOBS.get(job_id)
+    if job is not None:
+        JOBS.move_to_end(job_id)
+    return job
+
+def sweep_jobs(now: int) -> int:
+    """
+    Drop finished jobs not updated for DUMMYLLM_JOBS_TTL seconds.
+    Queued/running jobs are left alone. Returns number of jobs removed.
+    """
+    cutoff = now - DUMMYLLM_JOBS_TTL
+    stale = [k for k, j in JOBS.items() if j.state in TERMINAL_STATES and j.updated_at <= cutoff]
+    for k in stale:
+        del JOBS[k]
+    return len(stale)
+
+async def sweep_jobs_forever() -> None:
+    interval = max(1, min(60, DUMMYLLM_JOBS_TTL))
+    while True:
+        await asyncio.sleep(interval)
+        sweep_jobs(now_sec())
 
 def set_state(job: Job, state: State) -> None:
     job.state = state
     job.updated_at = now_sec()
 
+def finish(job: Job, state: State, result: Optional[Dict[str, Any]], error: Optional[Dict[str, str]]) -> None:
+    """
+    Move job to a terminal state. The status never changes again, so it is
+    serialized once from plain dicts into status_bytes; get_job serves those.
+    Only if orjson can't encode it (e.g. a lone surrogate) are result/error
+    models built, so get_job falls back to the response_model path.
+    """
+    set_state(job, state)
+    try:
+        job.status_bytes = orjson.dumps({
+            "id": job.id,
+            "state": job.state,
+            "created_at": job.created_at,
+            "updated_at": job.updated_at,
+            "result": result,
+            "error": error,
+        })
+    except orjson.JSONEncodeError:
+        job.result = JobResult(**result) if result else None
+        job.error = JobError(**error) if error else None
+
 def finish_ok(job: Job, text: str) -> None:
-    set_state(job, "ok")
-    job.result = JobResult(text=text)
-    job.error = None
+    finish(job, "ok", {"text": text, "usage": _DEFAULT_USAGE}, None)
 
 def finish_fail(job: Job, code: str, message: str) -> None:
-    set_state(job, "fail")
-    job.result = None
-    job.error = JobError(code=code, message=message)
+    finish(job, "fail", None, {"code": code, "message": message})
 
 def finish_timeout(job: Job) -> None:
-    set_state(job, "timeout")
-    job.result = None
-    job.error = JobError(code="TIMEOUT", message="simulated timeout")
+    finish(job, "timeout", None, {"code": "TIMEOUT", "message": "simulated timeout"})
 
 def finish_cancelled(job: Job) -> None:
-    set_state(job, "cancelled")
-    job.result = None
-    job.error = JobError(code="CANCELLED", message="cancelled by client")
+    finish(job, "cancelled", None, {"code": "CANCELLED", "message": "cancelled by client"})
 
 # ---------------- ELIZA ----------------
 
-_REFLECTIONS = {
+_REFLECTIONS: Mapping[str, str] = MappingProxyType({
     "i": "you",
     "me": "you",
     "my": "your",
@@ -213,29 +359,30 @@ _REFLECTIONS = {
     "your": "my",
     "yours": "mine",
     "mine": "yours",
-}
+})
 
-_FALLBACKS = [
+_FALLBACKS: Tuple[str, ...] = (
     "Please tell me more.",
     "How does that make you feel?",
     "Why do you say that?",
     "Can you elaborate on that?",
     "Let's explore that a bit further.",
-]
-
-_RULES: List[Tuple[str, List[str]]] = [
-    ("i need", ["Why do you need {x}?", "Would it really help you to get {x}?", "Are you sure you need {x}?"]),
-    ("i am", ["How long have you been {x}?", "How do you feel about being {x}?", "Why do you say you're {x}?"]),
-    ("i feel", ["Do you often feel {x}?", "When do you usually feel {x}?", "What makes you feel {x}?"]),
-    ("because", ["Is that the real reason?", "What other reasons come to mind?", "Does that reason apply to anything else?"]),
-    ("why", ["What do you think?", "Why do you ask?", "What answer would satisfy you?"]),
-    ("hello", ["Hello. How are you feeling today?", "Hi. What's on your mind?"]),
-    ("hi", ["Hello. How are you feeling today?", "Hi. What's on your mind?"]),
-    ("hey", ["Hello. How are you feeling today?", "Hi. What's on your mind?"]),
-    ("mother", ["Tell me more about your family.", "How is your relationship with your mother?"]),
-    ("father", ["Tell me more about your family.", "How is your relationship with your father?"]),
-    ("always", ["Can you think of a specific example?", "When exactly does that happen?"]),
-]
+)
+_FALLBACKS_LEN = len(_FALLBACKS)
+
+_RULES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("i need", ("Why do you need {x}?", "Would it really help you to get {x}?", "Are you sure you need {x}?")),
+    ("i am", ("How long have you been {x}?", "How do you feel about being {x}?", "Why do you say you're {x}?")),
+    ("i feel", ("Do you often feel {x}?", "When do you usually feel {x}?", "What makes you feel {x}?")),
+    ("because", ("Is that the real reason?", "What other reasons come to mind?", "Does that reason apply to anything else?")),
+    ("why", ("What do you think?", "Why do you ask?", "What answer would satisfy you?")),
+    ("hello", ("Hello. How are you feeling today?", "Hi. What's on your mind?")),
+    ("hi", ("Hello. How are you feeling today?", "Hi. What's on your mind?")),
+    ("hey", ("Hello. How are you feeling today?", "Hi. What's on your mind?")),
+    ("mother", ("Tell me more about your family.", "How is your relationship with your mother?")),
+    ("father", ("Tell me more about your family.", "How is your relationship with your father?")),
+    ("always", ("Can you think of a specific example?", "When exactly does that happen?")),
+)
 
 def _reflect(text: str) -> str:
     words = text.split()
@@ -245,32 +392,62 @@ def _reflect(text: str) -> str:
     return " ".join(out)
 
 def extract_last_user_message(args: Dict[str, Any]) -> str:
-    msgs = args.get("messages", [])
-    if not isinstance(msgs, list):
+    msgs = args.get("messages")
+    if not msgs or not isinstance(msgs, list):
         return ""
-    for m in reversed(msgs):
+    for i in range(len(msgs) - 1, -1, -1):
+        m = msgs[i]
         if isinstance(m, dict) and m.get("role") == "user":
             c = m.get("content")
-            return c if isinstance(c, str) else ""
+            # payload comes from JSON, so content is an exact str or not a string
+            return c if type(c) is str else ""
     return ""
 
-def eliza_reply(user_text: str, rng: random.Random) -> str:
+def eliza_reply(user_text: str, seed: int) -> str:
     s = (user_text or "").strip()
     if not s:
         return "Hello. What would you like to talk about?"
     low = s.lower()
     for pat, templates in _RULES:
-        if pat in low:
-            idx = low.find(pat) + len(pat)
-            tail = s[idx:].strip(" .!?")
-            x = _reflect(tail) if tail else ""
-            tpl = templates[int(rng.random() * len(templates))]
-            return tpl.format(x=x if x else "that")
-    return _FALLBACKS[int(rng.random() * len(_FALLBACKS))]
+        # one find() per rule instead of `in` + find(); first rule in order wins
+        idx = low.find(pat)
+        if idx < 0:
+            continue
+        tail = s[idx + len(pat):].strip(" .!?")
+        x = _reflect(tail) if tail else ""
+        tpl = templates[int(fast_uniform(seed) * len(templates))]
+        return tpl.format(x=x if x else "that")
+    return _FALLBACKS[int(fast_uniform(seed) * _FALLBACKS_LEN)]
 
 # ---------------- JOB RUNNER ----------------
 
-async def run_job(job: Job) -> None:
+def spawn_job(
+    job: Job,
+    slots: Optional[asyncio.Semaphore],
+    tasks: Optional[Set[asyncio.Task]],
+) -> None:
+    """
+    Start the job task. slots/tasks come from app.state (set in lifespan);
+    tasks holds strong refs to in-flight jobs so shutdown can cancel them.
+    """
+    task = asyncio.create_task(run_job(job, slots))
+    if tasks is not None:
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    job.task = task
+
+async def run_job(job: Job, slots: Optional[asyncio.Semaphore]) -> None:
+    # without a lifespan there is no semaphore and jobs run uncapped
+    if slots is None:
+        await simulate_job(job)
+        return
+    # at most DUMMYLLM_MAX_INFLIGHT jobs are simulated at once; the rest wait "queued"
+    async with slots:
+        if job.state != "queued":
+            return
+        await simulate_job(job)
+
+async def simulate_job(job: Job) -> None:
     set_state(job, "running")
 
     mode = job.chosen_mode
@@ -307,8 +484,7 @@ async def run_job(job: Job) -> None:
 
     # flaky: deterministic-ish per-job RNG
     if mode == "flaky":
-        r = random.Random(job.seed ^ int(job.id[-4:], 16) if job.id[-4:].isalnum() else job.seed)
-        x = r.random()
+        x = fast_uniform(job.seed ^ int(job.id[-4:], 16) if job.id[-4:].isalnum() else job.seed)
         if x < 0.5:
             finish_fail(job, "SIM_FLAKY", "flaky failure")
             return
@@ -317,6 +493,8 @@ async def run_job(job: Job) -> None:
         # else continue as ok (ELIZA)
 
     # echo: return args.messages verbatim (minified JSON string)
+    # stdlib json on purpose: it round-trips everything the request parser
+    # accepts (big ints, NaN, 1e+100) in one stable format; orjson does not
     if mode == "echo":
         payload = job.args.get("messages", [])
         txt = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
@@ -326,15 +504,14 @@ async def run_job(job: Job) -> None:
     # ok/slow/flaky-success: ELIZA for llm.chat, otherwise generic ok
     if job.op == "llm.chat":
         user_msg = extract_last_user_message(job.args)
-        rng = random.Random(job.seed)
-        finish_ok(job, eliza_reply(user_msg, rng))
+        finish_ok(job, eliza_reply(user_msg, job.seed))
     else:
         finish_ok(job, f"ok :: op={job.op}")
 
 # ---------------- ROUTES ----------------
 
-@app.get("/health")
-def health() -> Dict[str, Any]:
+@app.get("/health", response_model=HealthResp)
+async def health() -> Dict[str, Any]:
     return {
         "ok": True,
         "name": "dummyLLM",
@@ -346,13 +523,13 @@ def health() -> Dict[str, Any]:
     }
 
 @app.post("/v1/jobs", response_model=JobCreateResp, status_code=201)
-async def create_job(req: JobCreate) -> JobCreateResp:
+async def create_job(req: JobCreate, request: Request) -> Dict[str, Any]:
     if not req.op or not isinstance(req.op, str):
         raise HTTPException(status_code=400, detail={"error": {"code": "BAD_REQUEST", "message": "Missing op"}})
 
-    chosen = await choose_mode_for_job()
+    chosen = choose_mode_for_job()
 
-    job_id = f"job_{uuid.uuid4().hex[:12]}"
+    job_id = new_job_id()
     created = now_sec()
 
     job = Job(
@@ -369,50 +546,56 @@ async def create_job(req: JobCreate) -> JobCreateResp:
         seed=DUMMYLLM_SEED,
     )
 
-    JOBS[job_id] = job
-    job.task = asyncio.create_task(run_job(job))
+    store_job(job)
+    state = request.app.state
+    spawn_job(job, getattr(state, "job_slots", None), getattr(state, "job_tasks", None))
 
-    return JobCreateResp(id=job.id, state=job.state, created_at=job.created_at)
+    # plain dicts: response_model validates once, no model built here first
+    return {"id": job.id, "state": job.state, "created_at": job.created_at}
 
 @app.get("/v1/jobs/{job_id}", response_model=JobStatus)
-def get_job(job_id: str) -> JobStatus:
-    job = JOBS.get(job_id)
+async def get_job(job_id: str) -> Any:
+    job = lookup_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail={"error": {"code": "NOT_FOUND", "message": "job not found"}})
 
-    return JobStatus(
-        id=job.id,
-        state=job.state,
-        created_at=job.created_at,
-        updated_at=job.updated_at,
-        result=job.result,
-        error=job.error,
-    )
+    if job.status_bytes is not None:
+        # terminal: bypass response_model validation and serialization
+        return Response(content=job.status_bytes, media_type="application/json")
+
+    return {
+        "id": job.id,
+        "state": job.state,
+        "created_at": job.created_at,
+        "updated_at": job.updated_at,
+        "result": job.result,
+        "error": job.error,
+    }
 
 @app.get("/v1/jobs/{job_id}/request", response_model=JobRequestView)
-def get_job_request(job_id: str) -> JobRequestView:
-    job = JOBS.get(job_id)
+async def get_job_request(job_id: str) -> Dict[str, Any]:
+    job = lookup_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail={"error": {"code": "NOT_FOUND", "message": "job not found"}})
 
-    return JobRequestView(
-        op=job.op,
-        args=job.args,
-        timeout_ms=job.timeout_ms,
-        trace_id=job.trace_id,
-        chosen_mode=job.chosen_mode,
-        base_latency_ms=job.base_latency_ms,
-        random_weights=DUMMYLLM_RANDOM_WEIGHTS if DUMMYLLM_MODE == "random" else None,
-        seed=job.seed,
-    )
+    return {
+        "op": job.op,
+        "args": job.args,
+        "timeout_ms": job.timeout_ms,
+        "trace_id": job.trace_id,
+        "chosen_mode": job.chosen_mode,
+        "base_latency_ms": job.base_latency_ms,
+        "random_weights": DUMMYLLM_RANDOM_WEIGHTS if DUMMYLLM_MODE == "random" else None,
+        "seed": job.seed,
+    }
 
-@app.post("/v1/jobs/{job_id}/cancel")
-def cancel_job(job_id: str) -> Dict[str, Any]:
-    job = JOBS.get(job_id)
+@app.post("/v1/jobs/{job_id}/cancel", response_model=JobCancelResp)
+async def cancel_job(job_id: str) -> Dict[str, Any]:
+    job = lookup_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail={"error": {"code": "NOT_FOUND", "message": "job not found"}})
 
-    if job.state in ("ok", "fail", "timeout", "cancelled"):
+    if job.state in TERMINAL_STATES:
         return {"id": job.id, "state": job.state}
 
     finish_cancelled(job)
@@ -421,3 +604,12 @@ def cancel_job(job_id: str) -> Dict[str, Any]:
         job.task.cancel()
 
     return {"id": job.id, "state": job.state}
+
+# ---------------- MAIN ----------------
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # Single worker on purpose: JOBS lives in process memory, so a poll routed
+    # to another worker would 404. uvloop + httptools come with uvicorn[standard].
+    uvicorn.run("server:app", host="127.0.0.1", port=8787, loop="uvloop", http="httptools")